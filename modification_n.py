@@ -8,6 +8,10 @@ Changed GUI design to Notebook
 import tkinter as tk
 import tkinter.ttk
 import re
+import os
+import json
+import shutil
+import hashlib
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -141,6 +145,7 @@ class Application(tkinter.ttk.Notebook):
         self.skip = 0
         self.species = []
         self.plot_tuple = (0,)
+        self.cache = ResultCache()
 
     def main_menu(self):
         set_reactions = tkinter.ttk.Frame(self)  # first page
@@ -265,7 +270,7 @@ class Application(tkinter.ttk.Notebook):
             progress_bar.pack()
             progress.title('Calculating...')
 
-            cell.run()
+            cell.run(self.cache)
 
             progress.destroy()
 
@@ -410,7 +415,7 @@ class Cell:
     def __init__(self, name, reactions_list, concentration, runtime, timestep, skip, method):
         self.name = name
         self.reactions = reactions_list
-        self.concentrations = concentration
+        self.concentrations = dict(concentration)
         self.runtime = runtime
         self.time = 0
         self.timestep = timestep
@@ -586,17 +591,49 @@ class Cell:
         self.time += self.timestep
         return self.concentrations
 
-    def run(self):  # generates output
+    def cache_key(self):
+        """
+        Hashes the reaction network and the simulation inputs
+        Must be called before method_setup() replaces the method name with the integrator
+        :return: key for this exact run, key shared by all runtimes of the same setup
+        """
+        setup = {'reactions': [[reaction.name, reaction.k] for reaction in self.reactions],
+                 'concentrations': [[species, conc] for species, conc in self.concentrations.items()],
+                 'timestep': self.timestep,
+                 'skip': self.skip,
+                 'method': self.method}
+        base = hashlib.sha256(json.dumps(setup).encode()).hexdigest()
+        key = hashlib.sha256((base + repr(float(self.runtime))).encode()).hexdigest()
+        return key, base
+
+    def run(self, cache=None):  # generates output
         from time import time
         t = self.runtime
         aux = 0
         keys = []
-        integrator = self.method_setup()
+        mode = 'w'
+        t1 = time()
         for species in self.concentrations:
             keys.append(species)
-        with open(self.name + '.dat', 'w') as f:
-            t1 = time()
-            f.write('# time\t' + '\t'.join([key for key in keys]) + '\n')
+
+        if cache is not None:
+            key, base = self.cache_key()
+            if cache.fetch(key, self.name + '.dat'):
+                print('Loaded from cache in ' + str(time() - t1) + ' seconds!')
+                return
+            # continue from the final state of a shorter run with the same setup
+            state = cache.prefix(base, t, self.name + '.dat')
+            if state:
+                self.time = state['time']
+                self.timestep = state['timestep']
+                self.concentrations = dict(zip(keys, state['concentrations']))
+                aux = state['aux']
+                mode = 'a'
+
+        integrator = self.method_setup()
+        with open(self.name + '.dat', mode) as f:
+            if mode == 'w':
+                f.write('# time\t' + '\t'.join([key for key in keys]) + '\n')
             while self.time <= t:
                 if aux == 0:
                     f.write(str(round(self.time, 12)) + '\t' + '\t'.join(str(i) for i in self.concentrations.values()) + '\n')
@@ -604,6 +641,11 @@ class Cell:
                 integrator()
                 aux = (aux + 1) % self.skip
 
+        if cache is not None:
+            cache.store(key, base, t, self.name + '.dat',
+                        {'time': self.time, 'timestep': self.timestep, 'aux': aux,
+                         'concentrations': list(self.concentrations.values())})
+
         t2 = time()
         print('Done in ' + str(t2 - t1) + ' seconds!')
 
@@ -629,6 +671,97 @@ class Cell:
         return self.method
 
 
+# stores finished trajectories, evicts the least recently used ones above the size limit
+class ResultCache:
+    def __init__(self, directory='.rkcache', limit=100 * 2 ** 20):
+        """
+        :param directory: where the trajectories and the index are kept
+        :param limit: maximum total size of the stored trajectories, bytes
+        """
+        self.directory = directory
+        self.limit = limit
+        self.index_file = os.path.join(directory, 'index.json')
+        try:
+            with open(self.index_file) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.dat')
+
+    def save_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.index_file, 'w') as f:
+            json.dump(self.index, f)
+
+    def touch(self, key):
+        from time import time
+        self.index[key]['used'] = time()
+        self.save_index()
+
+    def prune(self):
+        """
+        Drops the entries whose trajectories were deleted outside the program
+        """
+        missing = [key for key in self.index if not os.path.exists(self.path(key))]
+        for key in missing:
+            del self.index[key]
+        if missing:
+            self.save_index()
+
+    def fetch(self, key, destination):
+        """
+        Copies the stored trajectory of an identical run
+        :return: True on a hit
+        """
+        self.prune()
+        if key not in self.index:
+            return False
+        shutil.copyfile(self.path(key), destination)
+        self.touch(key)
+        return True
+
+    def prefix(self, base, runtime, destination):
+        """
+        Finds the longest stored run of the same setup which is shorter than runtime
+        and copies its trajectory
+        :return: the final integrator state of that run, None if there is none
+        """
+        self.prune()
+        best = None
+        for key, entry in self.index.items():
+            if entry['base'] == base and entry['runtime'] < runtime:
+                if best is None or entry['runtime'] > self.index[best]['runtime']:
+                    best = key
+        if best is None:
+            return None
+        shutil.copyfile(self.path(best), destination)
+        self.touch(best)
+        return self.index[best]['state']
+
+    def store(self, key, base, runtime, source, state):
+        size = os.path.getsize(source)
+        if size > self.limit:
+            return
+        from time import time
+        self.prune()
+        os.makedirs(self.directory, exist_ok=True)
+        shutil.copyfile(source, self.path(key))
+        self.index[key] = {'base': base, 'runtime': runtime, 'size': size, 'used': time(), 'state': state}
+
+        total = sum(entry['size'] for entry in self.index.values())
+        while total > self.limit:
+            oldest = min(self.index, key=lambda k: self.index[k]['used'])
+            total -= self.index[oldest]['size']
+            del self.index[oldest]
+            try:
+                os.remove(self.path(oldest))
+            except OSError:
+                pass
+        self.save_index()
+
+
 # instantiates reactions
 class Reaction:
     def __init__(self, name, k):
@@ -654,8 +787,9 @@ class Reaction:
         return [counter(x) for x in self.products()]
 
 
-root = tk.Tk()
-root.title('Eulerinator')
-app = Application(master=root)
+if __name__ == '__main__':
+    root = tk.Tk()
+    root.title('Eulerinator')
+    app = Application(master=root)
 
-root.mainloop()
+    root.mainloop()
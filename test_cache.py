@@ -0,0 +1,90 @@
+"""
+Checks for the result cache: hits, prefix resume and LRU eviction
+Run with: python -m unittest test_cache
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from modification_n import Cell, Reaction, ResultCache
+
+
+# stands in for tk.StringVar, Cell only calls .get() on the method
+class Method:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.reactions = [Reaction('A+B=2C', 1.0), Reaction('C=A', 0.5)]
+        self.concentrations = {'A': 1.0, 'B': 0.5, 'C': 0.0}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def run_cell(self, name, runtime, method, cache=None):
+        name = os.path.join(self.directory, name)
+        Cell(name, self.reactions, self.concentrations, runtime, 1e-3, 7, Method(method)).run(cache)
+        with open(name + '.dat') as f:
+            return f.read()
+
+    def cache(self, limit=100 * 2 ** 20):
+        return ResultCache(os.path.join(self.directory, 'cache'), limit)
+
+    def test_concentrations_not_modified(self):
+        self.run_cell('run', 0.5, 'euler', self.cache())
+        self.assertEqual(self.concentrations, {'A': 1.0, 'B': 0.5, 'C': 0.0})
+
+    def test_hit(self):
+        for method in ('euler', 'rk4'):
+            cache = self.cache()
+            first = self.run_cell('first', 0.5, method, cache)
+            second = self.run_cell('second', 0.5, method, cache)
+            self.assertEqual(first, second)
+            self.assertEqual(len(cache.index), 1)
+            shutil.rmtree(cache.directory)
+
+    def test_prefix_resume(self):
+        for method, runtime in (('euler', 1.0), ('rk4', 1.0), ('heun_adaptive', 1e-3)):
+            cache = self.cache()
+            fresh = self.run_cell('fresh', runtime, method)
+            self.run_cell('short', runtime / 2, method, cache)
+            key, base = Cell('long', self.reactions, self.concentrations, runtime, 1e-3, 7,
+                             Method(method)).cache_key()
+            self.assertIsNotNone(cache.prefix(base, runtime, os.path.join(self.directory, 'probe.dat')))
+            resumed = self.run_cell('long', runtime, method, cache)
+            self.assertEqual(fresh, resumed)
+            self.assertEqual(len(cache.index), 2)
+            shutil.rmtree(cache.directory)
+
+    def test_eviction(self):
+        limit = 3000
+        cache = self.cache(limit)
+        for runtime in (0.1, 0.15, 0.2, 0.25):
+            self.run_cell('run', runtime, 'euler', cache)
+            self.assertLessEqual(sum(entry['size'] for entry in cache.index.values()), limit)
+            total = sum(os.path.getsize(cache.path(key)) for key in cache.index)
+            self.assertLessEqual(total, limit)
+        self.assertLess(len(cache.index), 4)
+        # the most recent run survives
+        self.assertIn(0.25, [entry['runtime'] for entry in cache.index.values()])
+
+    def test_missing_file_dropped(self):
+        cache = self.cache()
+        self.run_cell('first', 0.1, 'euler', cache)
+        (key,) = cache.index
+        os.remove(cache.path(key))
+        self.run_cell('second', 0.2, 'euler', cache)
+        self.assertNotIn(key, cache.index)
+        self.assertEqual(len(cache.index), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()